@@ -10,11 +10,33 @@ https://www.petfinder.com/developers/
 """
 
 
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from pandas import DataFrame
-from pandas.io.json import json_normalize
 import requests
+from requests.adapters import HTTPAdapter
+from threading import Lock
+import time
 from urllib.parse import urljoin
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _json_loads
+
+    def _loads(content):
+        # json.loads only accepts bytes from Python 3.6 onwards.
+        return _json_loads(content.decode('utf-8'))
+
+
+_ANIMAL_TYPES = ('dog', 'cat', 'rabbit', 'small-furry', 'horse', 'bird', 'scales-fins-other', 'barnyard')
+_SIZES = ('small', 'medium', 'large', 'xlarge')
+_GENDERS = ('male', 'female', 'unknown')
+_AGES = ('baby', 'young', 'adult', 'senior')
+_COATS = ('short', 'medium', 'long', 'wire', 'hairless', 'curly')
+_STATUSES = ('adoptable', 'adopted', 'found')
+_SORTS = ('recent', '-recent', 'distance', '-distance')
+
 
 #################################################################################################################
 #
@@ -37,7 +59,8 @@ class Petfinder(object):
         The secret key obtained from the Petfinder API passed when the :code:`Petfinder` class is initialized.
     auth : str
         The authorization token string returned when the connection to the Petfinder API is made with the specified
-        :code:`key` and :code:`secret`.
+        :code:`key` and :code:`secret`. The token is requested the first time it is needed and is refreshed
+        automatically shortly before it expires.
 
     Methods
     -------
@@ -70,7 +93,129 @@ class Petfinder(object):
         self.key = key
         self.secret = secret
         self._host = 'http://api.petfinder.com/v2/'
-        self._auth = self._authenticate()
+
+        self._session = self._create_session()
+
+        self._token = None
+        self._token_header = None
+        self._token_expiry = 0
+        self._token_lock = Lock()
+
+        self._static_results = {}
+
+    def __getstate__(self):
+        r"""
+        Returns the state of the :code:`Petfinder` instance for pickling and copying. The requests session and the
+        token lock cannot be pickled and are recreated by :code:`__setstate__`.
+
+        Returns
+        -------
+        dict
+            The instance attributes without the requests session and token lock.
+
+        """
+        state = self.__dict__.copy()
+
+        del state['_session']
+        del state['_token_lock']
+
+        return state
+
+    def __setstate__(self, state):
+        r"""
+        Restores the state of a pickled or copied :code:`Petfinder` instance with a new requests session and token lock.
+
+        Parameters
+        ----------
+        state : dict
+            The instance attributes returned by :code:`__getstate__`.
+
+        """
+        self.__dict__.update(state)
+
+        self._session = self._create_session()
+        self._token_lock = Lock()
+
+    def _create_session(self):
+        r"""
+        Internal function for creating the requests session used to send requests to the Petfinder API. The session
+        pools its connections to the API and authorizes each request with the current access token.
+
+        Returns
+        -------
+        requests.Session
+            The session of the :code:`Petfinder` instance.
+
+        """
+        session = requests.Session()
+        session.mount('http://', HTTPAdapter(pool_connections=20, pool_maxsize=20))
+        session.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=20))
+
+        session.auth = self._authorize
+
+        return session
+
+    @property
+    def _auth(self):
+        r"""
+        The current access token to the Petfinder API. A new token is requested if one has not yet been granted or
+        if the current token is within 60 seconds of expiring.
+
+        Returns
+        -------
+        str
+            Access token granted by the Petfinder API.
+
+        """
+        self._refresh_token()
+
+        return self._token
+
+    def _refresh_token(self):
+        r"""
+        Internal function for requesting a new access token when one has not yet been granted or the current token is
+        within 60 seconds of expiring. The Authorization header value is built once for each new token.
+
+        Returns
+        -------
+        None
+
+        """
+        if time.time() < self._token_expiry - 60:
+            return None
+
+        with self._token_lock:
+            if time.time() >= self._token_expiry - 60:
+                token, expires_in = self._authenticate()
+
+                self._token = token
+                self._token_header = 'Bearer ' + token
+                # The expiry is set last so a concurrent request never sees a new expiry with an old token.
+                self._token_expiry = time.time() + expires_in
+
+        return None
+
+    def _authorize(self, r):
+        r"""
+        Internal function used as the authentication handler of the requests session. Attaches the current access
+        token to each request sent to the Petfinder API.
+
+        Parameters
+        ----------
+        r : requests.PreparedRequest
+            The request about to be sent to the Petfinder API.
+
+        Returns
+        -------
+        requests.PreparedRequest
+            The request with the Authorization header set.
+
+        """
+        self._refresh_token()
+
+        r.headers['Authorization'] = self._token_header
+
+        return r
 
     def _authenticate(self):
         r"""
@@ -78,12 +223,14 @@ class Petfinder(object):
 
         Raises
         ------
+        PetfinderInvalidCredentials
+            Raised when the Petfinder API rejects the given :code:`key` and :code:`secret`.
 
         Returns
         -------
-        str
-            Access token granted by the Petfinder API. The access token stays live for 3600 seconds, or one hour,
-            at which point the user must reauthenticate.
+        tuple
+            Access token granted by the Petfinder API and the number of seconds until it expires. The access token
+            stays live for 3600 seconds, or one hour, at which point the user must reauthenticate.
 
         """
         endpoint = 'oauth2/token'
@@ -96,12 +243,40 @@ class Petfinder(object):
             'client_secret': self.secret
         }
 
-        r = requests.post(url, data=data)
+        # The session's authentication handler is disabled for the token request, which it would otherwise try to
+        # authorize with the token being requested.
+        r = self._session.post(url, data=data, auth=lambda r: r)
 
         if r.status_code == 401:
             raise PetfinderInvalidCredentials(message=r.reason, err='Invalid Credentials')
 
-        return r.json()['access_token']
+        body = _loads(r.content)
+
+        return body['access_token'], body['expires_in']
+
+    def _get_static_results(self, urls):
+        r"""
+        Internal function for requesting the animal type and breed endpoints of the Petfinder API. The data returned
+        by these endpoints rarely changes, so the results are kept for the lifetime of the :code:`Petfinder`
+        instance and only endpoints that have not yet been requested are sent to the API.
+
+        Parameters
+        ----------
+        urls : list of str
+            The Petfinder API endpoints to request.
+
+        Returns
+        -------
+        list
+            Copies of the JSON results for each endpoint in the same order as :code:`urls`.
+
+        """
+        missing = [url for url in dict.fromkeys(urls) if url not in self._static_results]
+
+        for url, result in zip(missing, _get_results(self._session, missing)):
+            self._static_results[url] = result
+
+        return [deepcopy(self._static_results[url]) for url in urls]
 
     def animal_types(self, types=None):
         r"""
@@ -135,8 +310,7 @@ class Petfinder(object):
             type_check = types
             if isinstance(types, str):
                 type_check = [types]
-            diff = set(type_check).difference(('dog', 'cat', 'rabbit', 'small-furry', 'horse', 'bird',
-                                               'scales-fins-other', 'barnyard'))
+            diff = set(type_check).difference(_ANIMAL_TYPES)
             if len(diff) > 0:
                 raise ValueError("animal types must be of the following 'dog', 'cat', 'rabbit', "
                                  "'small-furry', 'horse', 'bird', 'scales-fins-other', 'barnyard'")
@@ -144,37 +318,18 @@ class Petfinder(object):
         if types is None:
             url = urljoin(self._host, 'types')
 
-            r = _get_result(url,
-                            headers={
-                                'Authorization': 'Bearer ' + self._auth
-                            })
-
-            result = r.json()
+            result = self._get_static_results([url])[0]
 
         elif isinstance(types, str):
             url = urljoin(self._host, 'types/{type}'.format(type=types))
 
-            r = _get_result(url,
-                            headers={
-                                'Authorization': 'Bearer ' + self._auth
-                            })
-
-            result = r.json()
+            result = self._get_static_results([url])[0]
 
         elif isinstance(types, (tuple, list)):
-            types_collection = []
+            results = self._get_static_results([urljoin(self._host, 'types/{type}'.format(type=type))
+                                                for type in types])
 
-            for type in types:
-                url = urljoin(self._host, 'types/{type}'.format(type=type))
-
-                r = _get_result(url,
-                                headers={
-                                    'Authorization': 'Bearer ' + self._auth
-                                })
-
-                types_collection.append(r.json()['type'])
-
-            result = {'types': types_collection}
+            result = {'types': [result['type'] for result in results]}
 
         else:
             raise TypeError('types parameter must be either None, str, list or tuple')
@@ -224,40 +379,24 @@ class Petfinder(object):
             type_check = types
             if isinstance(types, str):
                 type_check = [types]
-            diff = set(type_check).difference(('dog', 'cat', 'rabbit', 'small-furry', 'horse', 'bird',
-                                               'scales-fins-other', 'barnyard'))
+            diff = set(type_check).difference(_ANIMAL_TYPES)
             if len(diff) > 0:
                 raise ValueError("animal types must be of the following 'dog', 'cat', 'rabbit', "
                                  "'small-furry', 'horse', 'bird', 'scales-fins-other', 'barnyard'")
 
         if types is None or isinstance(types, (list, tuple)):
-            breeds = []
-
             if types is None:
-                types = ('dog', 'cat', 'rabbit', 'small-furry',
-                         'horse', 'bird', 'scales-fins-other', 'barnyard')
-
-            for t in types:
-                url = urljoin(self._host, 'types/{type}/breeds'.format(type=t))
+                types = _ANIMAL_TYPES
 
-                r = _get_result(url,
-                                headers={
-                                    'Authorization': 'Bearer ' + self._auth
-                                })
+            results = self._get_static_results([urljoin(self._host, 'types/{type}/breeds'.format(type=t))
+                                                for t in types])
 
-                breeds.append({t: r.json()})
-
-            result = {'breeds': breeds}
+            result = {'breeds': [{t: result} for t, result in zip(types, results)]}
 
         elif isinstance(types, str):
             url = urljoin(self._host, 'types/{type}/breeds'.format(type=types))
 
-            r = _get_result(url,
-                            headers={
-                                'Authorization': 'Bearer ' + self._auth
-                            })
-
-            result = r.json()
+            result = self._get_static_results([url])[0]
 
         else:
             raise TypeError('types parameter must be either None, str, list or tuple')
@@ -265,18 +404,19 @@ class Petfinder(object):
         if return_df:
             raw_results = True
 
-            df_results = DataFrame()
-
             if isinstance(types, (tuple, list)):
+                breed_records = []
+
+                for type_name, type_breeds in zip(types, result['breeds']):
+                    breed_records.extend(type_breeds[type_name]['breeds'])
 
-                for t in range(0, len(types)):
-                    df_results = df_results.append(json_normalize(result['breeds'][t][types[t]]['breeds']))
+                df_results = _normalize_json(breed_records)
 
             else:
-                df_results = df_results.append(json_normalize(result['breeds']))
+                df_results = _normalize_json(result['breeds'])
 
             df_results.rename(columns={'_links.type.href': 'breed'}, inplace=True)
-            df_results['breed'] = df_results['breed'].str.replace('/v2/types/', '').str.capitalize()
+            df_results['breed'] = df_results['breed'].str.slice(len('/v2/types/')).str.capitalize()
 
             result = df_results
 
@@ -289,17 +429,11 @@ class Petfinder(object):
             }
 
             if isinstance(types, (tuple, list)):
-                for t in range(0, len(types)):
-                    json_result['breeds'][types[t]] = []
-
-                    for breed in result['breeds'][t][types[t]]['breeds']:
-                        json_result['breeds'][types[t]].append(breed['name'])
+                for type_name, type_breeds in zip(types, result['breeds']):
+                    json_result['breeds'][type_name] = [breed['name'] for breed in type_breeds[type_name]['breeds']]
 
             else:
-                json_result['breeds'][types] = []
-
-                for breed in result['breeds']:
-                    json_result['breeds'][types].append(breed['name'])
+                json_result['breeds'][types] = [breed['name'] for breed in result['breeds']]
 
             result = json_result
 
@@ -376,23 +510,14 @@ class Petfinder(object):
 
             if isinstance(animal_id, (tuple, list)):
 
-                animals = []
-
-                for ani_id in animal_id:
-                    r = _get_result(url.format(id=ani_id),
-                                    headers={
-                                        'Authorization': 'Bearer ' + self._auth
-                                    })
+                results = _get_results(self._session, [url.format(id=ani_id) for ani_id in animal_id])
 
-                    animals.append(r.json()['animal'])
+                animals = [result['animal'] for result in results]
 
             else:
-                r = _get_result(url.format(id=animal_id),
-                                headers={
-                                    'Authorization': 'Bearer ' + self._auth
-                                })
+                result = _get_result(self._session, url.format(id=animal_id))
 
-                animals = r.json()['animal']
+                animals = result['animal']
 
         else:
 
@@ -407,57 +532,37 @@ class Petfinder(object):
                 params['limit'] = 100
                 params['page'] = 1
 
-                r = _get_result(url,
-                                headers={
-                                    'Authorization': 'Bearer ' + self._auth
-                                },
-                                params=params)
+                result = _get_result(self._session, url, params=params)
 
-                animals = r.json()['animals']
-                max_pages = r.json()['pagination']['total_pages']
+                animals = result['animals']
+                max_pages = result['pagination']['total_pages']
 
-                for page in range(2, max_pages + 1):
+                page_params = [dict(params, page=page) for page in range(2, max_pages + 1)]
 
-                    params['page'] = page
+                results = _get_results(self._session, [url] * len(page_params), params=page_params)
 
-                    r = _get_result(url,
-                                    headers={
-                                        'Authorization': 'Bearer ' + self._auth
-                                    },
-                                    params=params)
-
-                    for i in r.json()['animals']:
-                        animals.append(i)
+                for result in results:
+                    animals.extend(result['animals'])
 
             else:
                 pages += 1
                 params['page'] = 1
 
-                r = _get_result(url,
-                                headers={
-                                    'Authorization': 'Bearer ' + self._auth
-                                },
-                                params=params)
+                result = _get_result(self._session, url, params=params)
 
-                animals = r.json()['animals']
-                max_pages = r.json()['pagination']['total_pages']
+                animals = result['animals']
+                max_pages = result['pagination']['total_pages']
 
                 if pages > int(max_pages):
                     pages = max_pages
                     max_page_warning = True
 
-                for page in range(2, pages):
-
-                    params['page'] = page
+                page_params = [dict(params, page=page) for page in range(2, pages)]
 
-                    r = _get_result(url,
-                                    headers={
-                                        'Authorization': 'Bearer ' + self._auth
-                                    },
-                                    params=params)
+                results = _get_results(self._session, [url] * len(page_params), params=page_params)
 
-                    for i in r.json()['animals']:
-                        animals.append(i)
+                for result in results:
+                    animals.extend(result['animals'])
 
         animals = {
             'animals': animals
@@ -524,23 +629,14 @@ class Petfinder(object):
 
             if isinstance(organization_id, (tuple, list)):
 
-                organizations = []
+                results = _get_results(self._session, [url.format(id=org_id) for org_id in organization_id])
 
-                for org_id in organization_id:
-                    r = _get_result(url.format(id=org_id),
-                                    headers={
-                                        'Authorization': 'Bearer ' + self._auth
-                                    })
-
-                    organizations.append(r.json()['organization'])
+                organizations = [result['organization'] for result in results]
 
             else:
-                r = _get_result(url.format(id=organization_id),
-                                headers={
-                                    'Authorization': 'Bearer ' + self._auth
-                                })
+                result = _get_result(self._session, url.format(id=organization_id))
 
-                organizations = r.json()['organization']
+                organizations = result['organization']
 
         else:
 
@@ -554,59 +650,37 @@ class Petfinder(object):
                 params['limit'] = 100
                 params['page'] = 1
 
-                r = _get_result(url,
-                                headers={
-                                    'Authorization': 'Bearer ' + self._auth
-                                },
-                                params=params)
-
-                organizations = r.json()['organizations']
+                result = _get_result(self._session, url, params=params)
 
-                max_pages = r.json()['pagination']['total_pages']
+                organizations = result['organizations']
+                max_pages = result['pagination']['total_pages']
 
-                for page in range(2, max_pages + 1):
+                page_params = [dict(params, page=page) for page in range(2, max_pages + 1)]
 
-                    params['page'] = page
+                results = _get_results(self._session, [url] * len(page_params), params=page_params)
 
-                    r = _get_result(url,
-                                    headers={
-                                        'Authorization': 'Bearer ' + self._auth
-                                    },
-                                    params=params)
-
-                    for i in r.json()['organizations']:
-                        organizations.append(i)
+                for result in results:
+                    organizations.extend(result['organizations'])
 
             else:
                 pages += 1
                 params['page'] = 1
 
-                r = _get_result(url,
-                                headers={
-                                    'Authorization': 'Bearer ' + self._auth
-                                },
-                                params=params)
-
-                organizations = r.json()['organizations']
+                result = _get_result(self._session, url, params=params)
 
-                max_pages = r.json()['pagination']['total_pages']
+                organizations = result['organizations']
+                max_pages = result['pagination']['total_pages']
 
                 if pages > int(max_pages):
                     pages = max_pages
                     max_page_warning = True
 
-                for page in range(2, pages):
+                page_params = [dict(params, page=page) for page in range(2, pages)]
 
-                    params['page'] = page
+                results = _get_results(self._session, [url] * len(page_params), params=page_params)
 
-                    r = _get_result(url,
-                                    headers={
-                                        'Authorization': 'Bearer ' + self._auth
-                                    },
-                                    params=params)
-
-                    for i in r.json()['organizations']:
-                        organizations.append(i)
+                for result in results:
+                    organizations.extend(result['organizations'])
 
         organizations = {
             'organizations': organizations
@@ -797,15 +871,14 @@ class PetfinderInvalidParameters(PetfinderError):
 #################################################################################################################
 
 
-def _get_result(url, headers, params=None):
+def _get_result(session, url, params=None):
 
-    r = requests.get(url,
-                     headers=headers,
-                     params=params)
+    r = session.get(url,
+                    params=params)
 
     if r.status_code == 400:
         raise PetfinderInvalidParameters(message='There are invalid parameters in the API query.',
-                                         err=r.json()['invalid-params'])
+                                         err=_loads(r.content)['invalid-params'])
 
     if r.status_code == 401:
         raise PetfinderInvalidCredentials(message='Invalid Credentials',
@@ -823,7 +896,42 @@ def _get_result(url, headers, params=None):
         raise PetfinderUnexpectedError(message='The Petfinder API encountered an unexpected error.',
                                        err=(r.reason, r.status_code))
 
-    return r
+    return _loads(r.content)
+
+
+def _get_results(session, urls, params=None, max_workers=10):
+    r"""
+    Internal function for concurrently sending a collection of requests to the Petfinder API.
+
+    Parameters
+    ----------
+    session : requests.Session
+        The authorized session of the :code:`Petfinder` instance. Requests sent with the session reuse its pooled
+        connections to the Petfinder API.
+    urls : list of str
+        The Petfinder API endpoints to request.
+    params : list of dict, optional
+        Query parameters for each request, aligned with :code:`urls`.
+    max_workers : int, default 10
+        Maximum number of requests sent to the Petfinder API at the same time.
+
+    Returns
+    -------
+    list
+        The JSON results returned from the Petfinder API in the same order as :code:`urls`.
+
+    """
+    if params is None:
+        params = [None] * len(urls)
+
+    if len(urls) == 0:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        results = executor.map(lambda args: _get_result(session, args[0], params=args[1]),
+                               zip(urls, params))
+
+        return list(results)
 
 
 def _parameters(breed=None, size=None, gender=None, color=None, coat=None, animal_type=None, location=None,
@@ -895,29 +1003,29 @@ def _parameters(breed=None, size=None, gender=None, color=None, coat=None, anima
     _check_parameters(animal_types=animal_type, size=size, gender=gender, age=age, coat=coat, status=status,
                       distance=distance, sort=sort, limit=results_per_page)
 
-    args = {
-        'breed': breed,
-        'size': size,
-        'gender': gender,
-        'age': age,
-        'color': color,
-        'coat': coat,
-        'animal_type': animal_type,
-        'location': location,
-        'distance': distance,
-        'state': state,
-        'country': country,
-        'query': query,
-        'sort': sort,
-        'name': name,
-        'animal_id': animal_id,
-        'organization_id': organization_id,
-        'status': status,
-        'limit': results_per_page,
-        'page': page
-    }
-
-    args = {key: val for key, val in args.items() if val is not None}
+    args = {}
+
+    for key, val in (('breed', breed),
+                     ('size', size),
+                     ('gender', gender),
+                     ('age', age),
+                     ('color', color),
+                     ('coat', coat),
+                     ('animal_type', animal_type),
+                     ('location', location),
+                     ('distance', distance),
+                     ('state', state),
+                     ('country', country),
+                     ('query', query),
+                     ('sort', sort),
+                     ('name', name),
+                     ('animal_id', animal_id),
+                     ('organization_id', organization_id),
+                     ('status', status),
+                     ('limit', results_per_page),
+                     ('page', page)):
+        if val is not None:
+            args[key] = val
 
     return args
 
@@ -965,75 +1073,66 @@ def _check_parameters(animal_types=None, size=None, gender=None, age=None, coat=
         parameters are valid.
 
     """
-    _animal_types = ('dog', 'cat', 'rabbit', 'small-furry',
-                     'horse', 'bird', 'scales-fins-other', 'barnyard')
-    _sizes = ('small', 'medium', 'large', 'xlarge')
-    _genders = ('male', 'female', 'unknown')
-    _ages = ('baby', 'young', 'adult', 'senior')
-    _coats = ('short', 'medium', 'long', 'wire', 'hairless', 'curly')
-    _status = ('adoptable', 'adopted', 'found')
-    _sort = ('recent', '-recent', 'distance', '-distance')
-
     incorrect_values = {}
 
-    if animal_types is not None and animal_types not in _animal_types:
+    if animal_types is not None and animal_types not in _ANIMAL_TYPES:
         incorrect_values['animal_types'] = "animal types {types} is not valid. Animal types " \
                                            "must of the following: {animal_types}"\
             .format(types=animal_types,
-                    animal_types=_animal_types)
+                    animal_types=_ANIMAL_TYPES)
 
     if size is not None:
         if isinstance(size, str):
             size = [size]
-        diff = set(size).difference(_sizes)
+        diff = set(size).difference(_SIZES)
 
         if len(diff) > 0:
             incorrect_values['size'] = "sizes {sizes} are not valid. Sizes must be of the following: {size_list}"\
                 .format(sizes=diff,
-                        size_list=_sizes)
+                        size_list=_SIZES)
 
     if gender is not None:
         if isinstance(gender, str):
             gender = [gender]
-        diff = set(gender).difference(_genders)
+        diff = set(gender).difference(_GENDERS)
 
         if len(diff) > 0:
             incorrect_values['gender'] = "genders {genders} are not valid. Genders must be of the following: " \
                                          "{gender_list}"\
                 .format(genders=diff,
-                        gender_list=_genders)
+                        gender_list=_GENDERS)
 
     if age is not None:
         if isinstance(age, str):
             age = [age]
-        diff = set(age).difference(_ages)
+        diff = set(age).difference(_AGES)
 
         if len(diff) > 0:
             incorrect_values['age'] = "ages {age} are not valid. Ages must be of the following: " \
                                       "{ages_list}"\
                 .format(age=diff,
-                        ages_list=_ages)
+                        ages_list=_AGES)
 
     if coat is not None:
         if isinstance(coat, str):
             coat = [coat]
-        diff = set(coat).difference(_coats)
+        diff = set(coat).difference(_COATS)
 
         if len(diff) > 0:
             incorrect_values['coat'] = "coats {coats} are not valid. Coats must be of the following: " \
                                        "{coat_list}"\
                 .format(coats=diff,
-                        coat_list=_coats)
+                        coat_list=_COATS)
 
-    if status is not None and status not in _status:
+    if status is not None and status not in _STATUSES:
         incorrect_values['status'] = "animal status {status} is not valid. Status must be of the following: " \
                                      "{statuses}".format(status=status,
-                                                         statuses=_status)
+                                                         statuses=_STATUSES)
 
-    if sort is not None and sort not in _sort:
+    if sort is not None and sort not in _SORTS:
         incorrect_values['sort'] = "sort order {sort} must be one of: {sort_list}"\
             .format(sort=sort,
-                    sort_list=_sort)
+                    sort_list=_SORTS)
 
     if distance is not None:
         if not 0 <= int(distance) <= 500:
@@ -1069,13 +1168,13 @@ def _coerce_to_dataframe(results):
 
     """
     key = list(results.keys())[0]
-    results_df = json_normalize(results[key])
+    results_df = _normalize_json(results[key])
 
     if key == 'animals':
         results_df['_links.organization.href'] = results_df['_links.organization.href']\
-            .str.replace('/v2/organizations/', '')
-        results_df['_links.self.href'] = results_df['_links.self.href'].str.replace('/v2/animals/', '')
-        results_df['_links.type.href'] = results_df['_links.type.href'].str.replace('/v2/types/', '')
+            .str.slice(len('/v2/organizations/'))
+        results_df['_links.self.href'] = results_df['_links.self.href'].str.slice(len('/v2/animals/'))
+        results_df['_links.type.href'] = results_df['_links.type.href'].str.slice(len('/v2/types/'))
 
         results_df.rename(columns={'_links.organization.href': 'organization_id',
                                    '_links.self.href': 'animal_id',
@@ -1083,8 +1182,68 @@ def _coerce_to_dataframe(results):
 
     if key == 'organizations':
         del results_df['_links.animals.href']
-        results_df['_links.self.href'] = results_df['_links.self.href'].str.replace('/v2/organizations/', '')
+        results_df['_links.self.href'] = results_df['_links.self.href'].str.slice(len('/v2/organizations/'))
 
         results_df.rename(columns={'_links.self.href': 'organization_id'}, inplace=True)
 
     return results_df
+
+
+def _normalize_json(data, sep='.'):
+    r"""
+    Internal function for flattening JSON results from the Petfinder API into a pandas DataFrame. Nested objects are
+    expanded into columns named by joining the nested keys with :code:`sep`, giving the same columns as pandas'
+    :code:`json_normalize` without its per-record overhead.
+
+    Parameters
+    ----------
+    data : dict or list of dict
+        JSON record or records returned from the Petfinder API.
+    sep : str, default '.'
+        Separator used to join nested keys into column names.
+
+    Returns
+    -------
+    pandas DataFrame
+        pandas DataFrame with one row per record.
+
+    """
+    if isinstance(data, dict):
+        data = [data]
+
+    return DataFrame([_flatten_json(record, sep=sep) for record in data])
+
+
+def _flatten_json(record, prefix='', sep='.'):
+    r"""
+    Internal function for flattening a single, possibly nested, JSON record into a dictionary with one level of keys.
+
+    Parameters
+    ----------
+    record : dict
+        JSON record returned from the Petfinder API.
+    prefix : str, default ''
+        String prepended to each key of the record. Used when flattening nested objects.
+    sep : str, default '.'
+        Separator used to join nested keys.
+
+    Returns
+    -------
+    dict
+        Flattened record.
+
+    """
+    flattened = {}
+    nested = []
+
+    for key, value in record.items():
+        if isinstance(value, dict):
+            nested.append((key, value))
+        else:
+            flattened[prefix + key] = value
+
+    # Nested objects follow the top-level values, keeping the column order given by json_normalize.
+    for key, value in nested:
+        flattened.update(_flatten_json(value, prefix=prefix + key + sep, sep=sep))
+
+    return flattened
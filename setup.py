@@ -15,6 +15,7 @@ setup(
     long_description=open('README.md').read(),
     long_description_content_type='text/markdown',
     install_requires=['pandas>=0.22.0', 'requests>=2.18.4'],
+    extras_require={'orjson': ['orjson']},
     classifiers=[
         'Development Status :: 5 - Production/Stable',
         'Environment :: Console',
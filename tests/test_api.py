@@ -1,5 +1,7 @@
 import os
+import pickle
 import pytest
+import time
 import vcr
 from pandas import DataFrame
 
@@ -28,8 +30,51 @@ def test_authentication():
     assert isinstance(p._auth, str)
 
 
+def test_authentication_refresh(monkeypatch):
+    tokens = [('tok1', 3600), ('tok2', 3600)]
+    calls = []
+
+    def authenticate(self):
+        calls.append(self)
+        return tokens[len(calls) - 1]
+
+    monkeypatch.setattr(Petfinder, '_authenticate', authenticate)
+
+    p = Petfinder(key='key', secret='secret')
+
+    assert len(calls) == 0
+
+    assert p._auth == 'tok1'
+    assert p._token_header == 'Bearer tok1'
+    assert len(calls) == 1
+
+    assert p._auth == 'tok1'
+    assert len(calls) == 1
+
+    p._token_expiry = time.time()
+
+    assert p._auth == 'tok2'
+    assert p._token_header == 'Bearer tok2'
+    assert len(calls) == 2
+
+
+def test_petfinder_pickle():
+    p = Petfinder(key='key', secret='secret')
+    p._token, p._token_header, p._token_expiry = 'tok1', 'Bearer tok1', time.time() + 3600
+
+    p2 = pickle.loads(pickle.dumps(p))
+
+    assert p2.key == 'key'
+    assert p2.secret == 'secret'
+    assert p2._auth == 'tok1'
+    assert p2._session is not p._session
+    assert p2._session.auth.__self__ is p2
+
+
+@vcr.use_cassette('tests/cassettes/authenticate.yml')
 def authenticate():
     pf = Petfinder(key=key, secret=secret_key)
+    assert isinstance(pf._auth, str)
 
     return pf
 
@@ -51,6 +96,9 @@ def test_animal_types():
     assert str.lower(response3['types'][0]['name']) == 'cat'
     assert str.lower(response3['types'][1]['name']) == 'dog'
 
+    response2['type']['name'] = 'Dog'
+    assert pf.animal_types('cat')['type']['name'] != response2['type']['name']
+
     with pytest.raises(ValueError):
         pf.animal_types(types='elephant')
     with pytest.raises(ValueError):
@@ -207,13 +255,14 @@ def test_petfinder_invalidcredentials():
     test_key, test_secret = 'test', 'test1'
 
     with pytest.raises(PetfinderError):
-        Petfinder(key=test_key, secret=test_secret)
+        Petfinder(key=test_key, secret=test_secret).animal_types()
     with pytest.raises(PetfinderInvalidCredentials):
-        Petfinder(key=test_key, secret=test_secret)
+        Petfinder(key=test_key, secret=test_secret).animal_types()
 
 
 def test_petfinder_insufficientaccess():
     p = Petfinder(key=key, secret=secret_key)
+    assert isinstance(p._auth, str)
 
     p._host = 'http://api.petfinder.com/v3/'
 